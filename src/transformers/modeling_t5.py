@@ -148,7 +148,7 @@ class T5LayerNorm(nn.Module):
 
     def forward(self, x):
         variance = x.pow(2).mean(-1, keepdim=True)
-        x = x / torch.sqrt(variance + self.variance_epsilon)
+        x = x * torch.rsqrt(variance + self.variance_epsilon)
         return self.weight * x
 
 